@@ -4,11 +4,19 @@ AWS DynamoDB Utils - Utility functions for working with AWS DynamoDB.
 
 from .dynamodb import (
     JobStatus,
+    JobLogBatcher,
+    UnprocessedItemsError,
+    DynamoConfig,
     create_job_log,
     get_job_id_by_name,
+    clear_job_id_cache,
     update_job_status_by_id,
     update_parent_job_id,
+    get_config,
+    use_config,
     set_table_name,
+    set_job_name_index,
+    set_output_key_index,
     set_dynamo_client,
     with_exponential_backoff,
     set_debug
@@ -17,11 +25,19 @@ from .dynamodb import (
 __version__ = "0.1.0"
 __all__ = [
     'JobStatus', 
+    'JobLogBatcher', 
+    'UnprocessedItemsError', 
+    'DynamoConfig', 
     'create_job_log', 
     'get_job_id_by_name', 
+    'clear_job_id_cache', 
     'update_job_status_by_id', 
     'update_parent_job_id',
+    'get_config',
+    'use_config',
     'set_table_name',
+    'set_job_name_index',
+    'set_output_key_index',
     'set_dynamo_client',
     'with_exponential_backoff',
     'set_debug'
@@ -0,0 +1,287 @@
+"""
+Async variants of the job status functions, built on aioboto3.
+
+Requires the optional dependency: pip install "dynamo_job_status[async]"
+
+Example:
+    async with async_dynamo_client():
+        job_ids = await asyncio.gather(*[
+            acreate_job_log("my-job", "data-processing", key, "my-bucket")
+            for key in input_keys
+        ])
+"""
+
+import asyncio
+import contextlib
+import threading
+from contextvars import ContextVar
+from typing import Optional, Dict, Any, AsyncIterator
+
+from botocore.exceptions import ClientError
+
+from .dynamodb import (
+    CLIENT_CONFIG,
+    _cache_job_id,
+    _get_cached_job_id,
+    _job_id_cache_key,
+    _job_status_update_request,
+    _new_job_log_item,
+    _scan_job_id_by_name,
+    _skipped_job_status_update,
+    get_config,
+    logger,
+    with_exponential_backoff,
+)
+
+try:
+    import aioboto3
+except ImportError:
+    aioboto3 = None
+
+# Client used by the a* functions inside an async_dynamo_client block
+_async_client: ContextVar[Optional[Any]] = ContextVar("dynamo_async_client", default=None)
+# Shared aioboto3 session, created on first use so botocore data is loaded once
+_session = None
+_session_lock = threading.Lock()
+
+
+def _get_session() -> Any:
+    """
+    Get the shared aioboto3 session.
+
+    Raises:
+        ImportError: If aioboto3 is not installed
+    """
+    global _session
+    if aioboto3 is None:
+        raise ImportError(
+            'aioboto3 is required for async operations: pip install "dynamo_job_status[async]"'
+        )
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                _session = aioboto3.Session()
+    return _session
+
+
+@contextlib.asynccontextmanager
+async def async_dynamo_client(client: Optional[Any] = None) -> AsyncIterator[Any]:
+    """
+    Use one async DynamoDB client for every a* call inside the block.
+
+    Tasks started inside the block (e.g. by asyncio.gather) share the client.
+    Outside a block, each call opens and closes its own client from a shared
+    session, so fan-out callers should open a block.
+
+    Args:
+        client: An existing aioboto3 / aiobotocore DynamoDB client; a new one is
+            opened (and closed on exit) if not given
+
+    Yields:
+        The client in use
+    """
+    if client is not None:
+        token = _async_client.set(client)
+        try:
+            yield client
+        finally:
+            _async_client.reset(token)
+        return
+
+    async with _get_session().client('dynamodb', config=CLIENT_CONFIG) as new_client:
+        token = _async_client.set(new_client)
+        try:
+            yield new_client
+        finally:
+            _async_client.reset(token)
+
+
+@contextlib.asynccontextmanager
+async def _client() -> AsyncIterator[Any]:
+    """Yields the active async client, opening a temporary one if there is none."""
+    client = _async_client.get()
+    if client is not None:
+        yield client
+    else:
+        async with async_dynamo_client() as client:
+            yield client
+
+
+@with_exponential_backoff()
+async def _aput_item(item: Dict[str, Any]) -> None:
+    """
+    Async version of the single-item write used by create_job_log.
+
+    Args:
+        item: The DynamoDB item to write
+    """
+    config = get_config()
+    async with _client() as client:
+        await client.put_item(TableName=config.table_name, Item=item)
+    logger.debug("Log inserted successfully with ID: %s", item['id']['S'])
+
+
+async def acreate_job_log(
+    job_name: str,
+    job_type: str,
+    input_key: str,
+    bucket_name: str,
+) -> str:
+    """
+    Async version of create_job_log.
+
+    Writes are not buffered by JobLogBatcher; run calls concurrently instead.
+
+    Args:
+        job_name: The name of the job
+        job_type: The type of the job
+        input_key: The key of the input file
+        bucket_name: The name of the bucket
+
+    Returns:
+        The ID of the job
+    """
+    job_id, item = _new_job_log_item(job_name, job_type, input_key, bucket_name)
+    await _aput_item(item)
+    return job_id
+
+
+async def aget_job_id_by_name(job_name: str) -> Optional[str]:
+    """
+    Async version of get_job_id_by_name, sharing its cache of found jobs.
+
+    Args:
+        job_name: The name of the job
+
+    Returns:
+        The ID of the job or None if not found
+    """
+    config = get_config()
+    cache_key = _job_id_cache_key(config, job_name)
+    job_id = _get_cached_job_id(cache_key)
+    if job_id is not None:
+        return job_id
+
+    if config.job_name_index is None:
+        # The parallel scan fallback already runs on its own threads
+        job_id = await asyncio.to_thread(_scan_job_id_by_name, config, job_name)
+    else:
+        job_id = await _aquery_job_id_by_name(job_name)
+    if job_id is not None:
+        _cache_job_id(cache_key, job_id)
+    return job_id
+
+
+@with_exponential_backoff()
+async def _aquery_job_id_by_name(job_name: str) -> Optional[str]:
+    """
+    Async version of the jobName index query used by get_job_id_by_name.
+
+    Args:
+        job_name: The name of the job
+
+    Returns:
+        The ID of the job or None if not found
+    """
+    config = get_config()
+    async with _client() as client:
+        response = await client.query(
+            TableName=config.table_name,
+            IndexName=config.job_name_index,
+            KeyConditionExpression="jobName = :job_name",
+            ExpressionAttributeValues={":job_name": {"S": job_name}},
+            Select="ALL_PROJECTED_ATTRIBUTES",
+            Limit=1  # Limit to just one item since job_name should be unique
+        )
+
+    items = response.get('Items', [])
+    if not items:
+        logger.debug("No job found with name: %s", job_name)
+        return None
+
+    job_id = items[0]["id"]["S"]
+    logger.debug("Found job with ID: %s", job_id)
+    return job_id
+
+
+@with_exponential_backoff()
+async def aupdate_job_status_by_id(
+    job_id: str,
+    status: str,
+    message: Optional[str] = None,
+    output_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Async version of update_job_status_by_id.
+
+    Args:
+        job_id: The ID of the job
+        status: The status of the job
+        message: The message of the job
+        output_key: The key of the output file
+
+    Returns:
+        The update_item response (only the UPDATED_NEW attributes, plus
+        ResponseMetadata) if the job was updated. If the write was skipped,
+        {'Attributes': <full stored item>} with no ResponseMetadata.
+    """
+    config = get_config()
+    request = _job_status_update_request(config, job_id, status, message, output_key)
+    try:
+        async with _client() as client:
+            response = await client.update_item(**request)
+    except ClientError as e:
+        return _skipped_job_status_update(e, job_id, status)
+    logger.debug("Job status updated successfully")
+    return response
+
+
+@with_exponential_backoff()
+async def aupdate_parent_job_id(
+    job_id: str,
+    input_key: Optional[str] = None,
+    parent_job_id: Optional[str] = None
+) -> bool:
+    """
+    Async version of update_parent_job_id.
+
+    Args:
+        job_id: The ID of the job
+        input_key: The key of the input file
+        parent_job_id: The ID of the parent job, if already known
+
+    Returns:
+        True if the parent job id was updated, False otherwise
+    """
+    if parent_job_id is None and input_key is None:
+        raise ValueError("Either input_key or parent_job_id must be provided")
+
+    config = get_config()
+    async with _client() as client:
+        if parent_job_id is None:
+            # get parent job id from dynamo
+            response = await client.query(
+                TableName=config.table_name,
+                IndexName=config.output_key_index,
+                KeyConditionExpression="outputKey = :output_key",
+                ExpressionAttributeValues={":output_key": {"S": input_key}},
+                ProjectionExpression="id",
+                Limit=1
+            )
+
+            items = response.get('Items', [])
+            if not items:
+                logger.debug("❌ No parent job found for input key: %s", input_key)
+                return False
+
+            parent_job_id = items[0]["id"]["S"]
+
+        # update item to have parentJobId
+        await client.update_item(
+            TableName=config.table_name,
+            Key={'id': {'S': job_id}},
+            UpdateExpression="SET parentJobId = :parent_job_id",
+            ExpressionAttributeValues={':parent_job_id': {'S': parent_job_id}}
+        )
+    logger.debug("✅ Successfully updated parentJobId for job %s to %s", job_id, parent_job_id)
+    return True
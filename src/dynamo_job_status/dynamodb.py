@@ -1,18 +1,101 @@
 import boto3
+from boto3.dynamodb.types import TypeSerializer
 from datetime import datetime, UTC
+from enum import StrEnum
+import random
+import threading
 import time
 import uuid
-from botocore.exceptions import ClientError
-from tenacity import retry, stop_after_attempt, wait_exponential, retry_if_exception_type
+from botocore.config import Config as BotocoreConfig
+from botocore.exceptions import ClientError, ConnectionError as BotocoreConnectionError, HTTPClientError
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed
+import contextlib
+from contextvars import ContextVar
+from dataclasses import dataclass, replace
 import functools
-from typing import Optional, Dict, Any
+import inspect
+import itertools
+import logging
+from typing import Optional, Dict, Any, Iterator, List, Tuple
 
-# Default table name - can be overridden
-TABLE_NAME = "workers-job-status"
-dynamo_client = boto3.client('dynamodb')
+
+@dataclass(frozen=True)
+class DynamoConfig:
+    """
+    Settings used by the DynamoDB operations in this module.
+    
+    Attributes:
+        table_name: The name of the DynamoDB table
+        job_name_index: The GSI (partition key: jobName) used to look up jobs by name,
+            or None to fall back to a parallel scan
+        output_key_index: The GSI (partition key: outputKey) used to look up parent jobs
+        client: The boto3 DynamoDB client instance (None uses a shared default client)
+    """
+    table_name: str = "workers-job-status"
+    job_name_index: Optional[str] = "jobName-index"
+    output_key_index: str = "outputKey-index"
+    client: Any = None
+
+
+# Keep connections alive and leave retries to with_exponential_backoff
+CLIENT_CONFIG = BotocoreConfig(
+    tcp_keepalive=True,
+    max_pool_connections=50,
+    retries={'mode': 'standard', 'max_attempts': 1},
+    connect_timeout=1,
+    read_timeout=3,
+)
+# Default client, created on first use so importing the module stays cheap
+_default_client = None
+_default_client_lock = threading.Lock()
+# Process-wide configuration - changed by the set_* functions
+_default_config = DynamoConfig()
+# Per-thread / per-task override installed by use_config
+_config_override: ContextVar[Optional[DynamoConfig]] = ContextVar("dynamo_config", default=None)
 DEBUG=False
+logger = logging.getLogger(__name__)
+# Shared serializer for converting Python values to DynamoDB attribute values
+_SERIALIZER = TypeSerializer()
+# Maximum number of put requests DynamoDB accepts in a single BatchWriteItem call
+BATCH_WRITE_LIMIT = 25
+# ClientError codes worth retrying; anything else fails immediately
+_TRANSIENT_CODES = frozenset({
+    "ProvisionedThroughputExceededException",
+    "ThrottlingException",
+    "RequestLimitExceeded",
+    "InternalServerError",
+    "ServiceUnavailable",
+})
+# Attribute names of a job log item, in the order create_job_log fills them
+_JOB_LOG_ATTRS = (
+    'id', 'jobName', 'jobType', 'inputKey', 'bucketName', 'jobStatus', 'createdAt', 'updatedAt'
+)
+# Number of segments scanned concurrently when there is no jobName index
+SCAN_SEGMENTS = 8
+# Maximum number of jobName -> id lookups kept by get_job_id_by_name
+JOB_ID_CACHE_SIZE = 1024
+# Least recently used entries are evicted first
+_job_id_cache: "OrderedDict[Tuple[str, int, str], str]" = OrderedDict()
+_job_id_cache_lock = threading.Lock()
+# Batcher that create_job_log writes into while a JobLogBatcher block is active
+_active_batcher: ContextVar[Optional["JobLogBatcher"]] = ContextVar("dynamo_job_log_batcher", default=None)
+
+class UnprocessedItemsError(Exception):
+    """Raised when BatchWriteItem returns UnprocessedItems, so the write is retried."""
 
-class JobStatus:
+    def __init__(self, unprocessed: List[Dict[str, Any]]):
+        super().__init__(f"{len(unprocessed)} items were not processed")
+        self.unprocessed = unprocessed
+
+
+# Errors with_exponential_backoff may retry. Connection errors and timeouts
+# (EndpointConnectionError, ConnectionClosedError, ReadTimeoutError, ...) are
+# included because botocore's own retries are disabled in CLIENT_CONFIG.
+_RETRY_ERRORS = (ClientError, UnprocessedItemsError, BotocoreConnectionError, HTTPClientError)
+
+
+class JobStatus(StrEnum):
     """Constants representing possible job states."""
     PENDING = "PENDING"
     COMPLETE = "COMPLETE"
@@ -20,6 +103,105 @@ class JobStatus:
     PROCESSING = "PROCESSING"
 
 
+# Statuses after which a job is finished and gets a completedAt timestamp
+_TERMINAL_STATES = frozenset({JobStatus.COMPLETE, JobStatus.FAILED})
+
+
+def _build_update_expressions() -> Dict[Tuple[bool, bool, bool], Tuple[str, str]]:
+    """
+    Builds every (UpdateExpression, ConditionExpression) pair used by update_job_status_by_id.
+    
+    Returns:
+        A mapping of (has_message, has_output_key, is_terminal) to the expression pair
+    """
+    expressions = {}
+    for has_message, has_output_key, is_terminal in itertools.product((False, True), repeat=3):
+        # Start with basic update expression and condition
+        update_expression = "SET jobStatus = :status, updatedAt = :updated_at"
+        condition_expression = "attribute_not_exists(jobStatus) OR jobStatus <> :status"
+        
+        # Conditionally add message if provided
+        if has_message:
+            update_expression += ", message = :message"
+            condition_expression += " OR attribute_not_exists(message) OR message <> :message"
+        
+        # Conditionally add output_key if provided
+        if has_output_key:
+            update_expression += ", outputKey = :output_key"
+            condition_expression += " OR attribute_not_exists(outputKey) OR outputKey <> :output_key"
+        
+        # if job ended, add completedAt
+        if is_terminal:
+            update_expression += ", completedAt = :completed_at"
+        
+        expressions[(has_message, has_output_key, is_terminal)] = (update_expression, condition_expression)
+    return expressions
+
+
+_UPDATE_EXPRESSIONS = _build_update_expressions()
+
+
+def get_config() -> DynamoConfig:
+    """
+    Get the configuration in effect for the current thread or asyncio task.
+    
+    Returns:
+        The active use_config override, or the process-wide configuration
+    """
+    config = _config_override.get()
+    return _default_config if config is None else config
+
+
+@contextlib.contextmanager
+def use_config(**changes: Any) -> Iterator[DynamoConfig]:
+    """
+    Override configuration for the current thread or asyncio task only.
+    
+    Example:
+        with use_config(table_name="other-table"):
+            create_job_log("my-job", "data-processing", "input.txt", "my-bucket")
+    
+    Args:
+        **changes: DynamoConfig fields to override
+        
+    Yields:
+        The configuration in effect inside the block
+    """
+    config = replace(get_config(), **changes)
+    token = _config_override.set(config)
+    try:
+        yield config
+    finally:
+        _config_override.reset(token)
+
+
+def _get_client(config: DynamoConfig) -> Any:
+    """
+    Get the DynamoDB client to use with the given configuration.
+    
+    Args:
+        config: The active configuration
+        
+    Returns:
+        The configured client, or the shared default client (created on first use)
+    """
+    if config.client is not None:
+        return config.client
+    global _default_client
+    if _default_client is None:
+        with _default_client_lock:
+            if _default_client is None:
+                _default_client = boto3.client('dynamodb', config=CLIENT_CONFIG)
+                logger.debug("Default DynamoDB client created")
+    return _default_client
+
+
+def _update_default_config(**changes: Any) -> None:
+    """Replace fields of the process-wide configuration."""
+    global _default_config
+    _default_config = replace(_default_config, **changes)
+
+
 def set_table_name(table_name: str) -> None:
     """
     Set the DynamoDB table name to use for operations.
@@ -27,20 +209,48 @@ def set_table_name(table_name: str) -> None:
     Args:
         table_name: The name of the DynamoDB table
     """
-    global TABLE_NAME
-    TABLE_NAME = table_name
-    print(f"DynamoDB table name set to: {TABLE_NAME}")
+    _update_default_config(table_name=table_name)
+    print(f"DynamoDB table name set to: {table_name}")
+
+
+def set_job_name_index(index_name: Optional[str]) -> None:
+    """
+    Set the name of the GSI used to look up jobs by jobName.
+    
+    Args:
+        index_name: The name of the Global Secondary Index, or None to look up
+            jobs with a parallel scan until the index exists
+    """
+    _update_default_config(job_name_index=index_name)
+    print(f"DynamoDB jobName index set to: {index_name}")
+
+
+def set_output_key_index(index_name: str) -> None:
+    """
+    Set the name of the GSI used to look up jobs by outputKey.
+    
+    Args:
+        index_name: The name of the Global Secondary Index
+    """
+    _update_default_config(output_key_index=index_name)
+    print(f"DynamoDB outputKey index set to: {index_name}")
 
 
 def set_debug(debug: bool) -> None:
     """
     Set the debug flag.
     
+    Enables DEBUG-level output from this module's logger.
+    
     Args:
         debug: The debug flag
     """
     global DEBUG
     DEBUG = debug
+    logger.setLevel(logging.DEBUG if debug else logging.NOTSET)
+    # Make debug output visible if neither this logger nor an ancestor has a handler
+    if debug and not logger.hasHandlers():
+        logger.addHandler(logging.StreamHandler())
     print(f"Debug flag set to: {DEBUG}")
 
     
@@ -51,36 +261,200 @@ def set_dynamo_client(client: Any) -> None:
     Args:
         client: A boto3 DynamoDB client instance
     """
-    global dynamo_client
-    dynamo_client = client
-    if DEBUG:
-        print("Custom DynamoDB client set")
+    _update_default_config(client=client)
+    logger.debug("Custom DynamoDB client set")
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Returns True if the error is transient and the operation may succeed on retry."""
+    if isinstance(error, ClientError):
+        return error.response.get('Error', {}).get('Code') in _TRANSIENT_CODES
+    return True
 
 
 def with_exponential_backoff(max_attempts=3, min_wait=2, max_wait=10):
     """
     Generic decorator for DynamoDB operations with exponential backoff retry.
     
+    Only throttling and transient service errors, connection errors and timeouts
+    (and unprocessed batch items) are retried; other ClientErrors such as ValidationException are raised immediately.
+    Coroutine functions are supported and wait with asyncio.sleep between attempts.
+    
     Args:   
-        max_attempts: Maximum number of retry attempts
-        min_wait: Minimum wait time in seconds
+        max_attempts: Maximum number of attempts, including the first call (at least 1)
+        min_wait: Upper bound of the first (randomized) wait in seconds
         max_wait: Maximum wait time in seconds
+        
+    Raises:
+        ValueError: If max_attempts is less than 1
     """
+    if max_attempts < 1:
+        raise ValueError(f"max_attempts must be at least 1, got {max_attempts}")
+
     def decorator(func):
+        if inspect.iscoroutinefunction(func):
+            # Imported here so sync-only users don't pay for loading asyncio
+            import asyncio
+
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                for attempt in range(max_attempts):
+                    try:
+                        return await func(*args, **kwargs)
+                    except _RETRY_ERRORS as e:
+                        if not _is_retryable(e) or attempt == max_attempts - 1:
+                            raise
+                        await asyncio.sleep(random.uniform(0, min(max_wait, min_wait * 2 ** attempt)))
+            return async_wrapper
+
         @functools.wraps(func)
-        @retry(
-            retry=retry_if_exception_type(ClientError),
-            stop=stop_after_attempt(max_attempts),
-            wait=wait_exponential(multiplier=1, min=min_wait, max=max_wait),
-            reraise=True
-        )
         def wrapper(*args, **kwargs):
-            return func(*args, **kwargs)
+            for attempt in range(max_attempts):
+                try:
+                    return func(*args, **kwargs)
+                except _RETRY_ERRORS as e:
+                    if not _is_retryable(e) or attempt == max_attempts - 1:
+                        raise
+                    # Full jitter keeps parallel workers from retrying in lockstep
+                    time.sleep(random.uniform(0, min(max_wait, min_wait * 2 ** attempt)))
         return wrapper
     return decorator
 
 
 @with_exponential_backoff()
+def _batch_write_items(config: DynamoConfig, requests: List[Dict[str, Any]]) -> None:
+    """
+    Writes up to BATCH_WRITE_LIMIT put requests with a single BatchWriteItem call.
+    
+    Any UnprocessedItems returned by DynamoDB replace the contents of `requests`
+    and are retried with exponential backoff.
+    
+    Args:
+        config: The configuration the items were logged under
+        requests: The write requests, e.g. [{'PutRequest': {'Item': item}}]
+    """
+    response = _get_client(config).batch_write_item(RequestItems={config.table_name: requests})
+    unprocessed = response.get('UnprocessedItems', {}).get(config.table_name, [])
+    if unprocessed:
+        requests[:] = unprocessed
+        logger.debug("Retrying %d unprocessed items", len(unprocessed))
+        raise UnprocessedItemsError(unprocessed)
+    logger.debug("Batch of %d logs inserted successfully", len(requests))
+
+
+class JobLogBatcher:
+    """
+    Context manager that buffers create_job_log writes and flushes them via BatchWriteItem.
+    
+    Inside the block, create_job_log returns the generated job ID immediately and
+    the item is written when the buffer fills up or the block exits. Items are
+    written with the table and client in effect when they were logged, so
+    use_config / set_table_name changes inside the block are respected.
+    
+    If a flush fails (ClientError, or UnprocessedItemsError once retries run
+    out), the error is raised - including from the end of the `with` block - and
+    the unwritten items stay buffered, so calling flush() again retries them.
+    
+    Example:
+        with JobLogBatcher():
+            for key in input_keys:
+                create_job_log("my-job", "data-processing", key, "my-bucket")
+    """
+
+    def __init__(self, batch_size: int = BATCH_WRITE_LIMIT):
+        """
+        Args:
+            batch_size: Number of items to buffer before flushing (capped at BATCH_WRITE_LIMIT)
+        """
+        self.batch_size = max(1, min(batch_size, BATCH_WRITE_LIMIT))
+        # Buffered requests per (table name, client), with the config they were logged under
+        self.buffers: Dict[Tuple[str, int], Tuple[DynamoConfig, List[Dict[str, Any]]]] = {}
+        self._token = None
+
+    def __enter__(self) -> "JobLogBatcher":
+        self._token = _active_batcher.set(self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        try:
+            self.flush()
+        finally:
+            _active_batcher.reset(self._token)
+            self._token = None
+
+    def add(self, item: Dict[str, Any]) -> None:
+        """
+        Buffers an item under the active config, flushing once its buffer reaches the batch size.
+        
+        Args:
+            item: The DynamoDB item to write
+        """
+        config = get_config()
+        key = (config.table_name, id(config.client))
+        buffered_config, buffer = self.buffers.setdefault(key, (config, []))
+        buffer.append({'PutRequest': {'Item': item}})
+        if len(buffer) >= self.batch_size:
+            self._flush_buffer(buffered_config, buffer)
+
+    def flush(self) -> None:
+        """
+        Writes all buffered items to DynamoDB.
+        
+        Raises:
+            ClientError: If a batch write fails; unwritten items stay buffered
+            UnprocessedItemsError: If items remain unprocessed after retries; they stay buffered
+        """
+        for key, (config, buffer) in list(self.buffers.items()):
+            self._flush_buffer(config, buffer)
+            del self.buffers[key]
+
+    def _flush_buffer(self, config: DynamoConfig, buffer: List[Dict[str, Any]]) -> None:
+        """Writes one buffer in chunks of at most the batch size, keeping unwritten items on failure."""
+        while buffer:
+            requests = buffer[:self.batch_size]
+            try:
+                _batch_write_items(config, requests)
+            except Exception:
+                # `requests` has been narrowed to the items that are still unwritten
+                buffer[:self.batch_size] = requests
+                raise
+            del buffer[:self.batch_size]
+
+
+@with_exponential_backoff()
+def _put_item(item: Dict[str, Any]) -> None:
+    """
+    Writes a single item to the DynamoDB table.
+    
+    Args:
+        item: The DynamoDB item to write
+    """
+    config = get_config()
+    _get_client(config).put_item(TableName=config.table_name, Item=item)
+    logger.debug("Log inserted successfully with ID: %s", item['id']['S'])
+
+
+def _new_job_log_item(
+    job_name: str,
+    job_type: str,
+    input_key: str,
+    bucket_name: str,
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Builds the DynamoDB item for a new PENDING job.
+    
+    Returns:
+        The generated job ID and the item
+    """
+    # Generate a unique ID for each job
+    job_id = uuid.uuid4().hex
+    now_iso = datetime.now(UTC).isoformat()
+    
+    values = (job_id, job_name, job_type, input_key, bucket_name, JobStatus.PENDING, now_iso, now_iso)
+    item = {name: _SERIALIZER.serialize(value) for name, value in zip(_JOB_LOG_ATTRS, values)}
+    return job_id, item
+
+
 def create_job_log(
     job_name: str,
     job_type: str,
@@ -90,6 +464,8 @@ def create_job_log(
     """
     Logs job status to a DynamoDB table with retries and exception handling.
     
+    Inside a JobLogBatcher block the write is buffered and sent via BatchWriteItem.
+    
     Args:
         job_name: The name of the job
         job_type: The type of the job
@@ -99,152 +475,358 @@ def create_job_log(
     Returns:
         The ID of the job
     """
-    # Generate a unique ID for each job
-    job_id = str(uuid.uuid4())
-    
-    item = {
-        'id': {'S': job_id},
-        'jobName': {'S': job_name},
-        'jobType': {'S': job_type},
-        'inputKey': {'S': input_key},
-        'bucketName': {'S': bucket_name},
-        'jobStatus': {'S': JobStatus.PENDING},
-        'createdAt': {'S': datetime.now(UTC).isoformat()},
-        'updatedAt': {'S': datetime.now(UTC).isoformat()},
-    }
+    job_id, item = _new_job_log_item(job_name, job_type, input_key, bucket_name)
 
-    dynamo_client.put_item(TableName=TABLE_NAME, Item=item)
-    if DEBUG:
-        print(f"Log inserted successfully with ID: {job_id}")
+    batcher = _active_batcher.get()
+    if batcher is not None:
+        batcher.add(item)
+    else:
+        _put_item(item)
     return job_id
 
 
-@with_exponential_backoff()
+def clear_job_id_cache() -> None:
+    """
+    Clear the cached jobName -> id lookups made by get_job_id_by_name.
+    """
+    with _job_id_cache_lock:
+        _job_id_cache.clear()
+    logger.debug("Job ID cache cleared")
+
+
+def _job_id_cache_key(config: DynamoConfig, job_name: str) -> Tuple[str, int, str]:
+    """
+    Builds the cache key for a jobName lookup.
+    
+    The client is part of the key (as in JobLogBatcher), so lookups against
+    another account, region or endpoint with the same table name don't share ids.
+    """
+    return (config.table_name, id(config.client), job_name)
+
+
+def _get_cached_job_id(cache_key: Tuple[str, int, str]) -> Optional[str]:
+    """Returns the cached id for a (table name, client, jobName) key, if any."""
+    with _job_id_cache_lock:
+        job_id = _job_id_cache.get(cache_key)
+        if job_id is not None:
+            # Mark as most recently used
+            _job_id_cache.move_to_end(cache_key)
+    if job_id is not None:
+        logger.debug("Found cached job with ID: %s", job_id)
+    return job_id
+
+
+def _cache_job_id(cache_key: Tuple[str, int, str], job_id: str) -> None:
+    """Caches the id for a (table name, client, jobName) key."""
+    with _job_id_cache_lock:
+        # Evict the least recently used entry once the cache is full
+        if cache_key not in _job_id_cache and len(_job_id_cache) >= JOB_ID_CACHE_SIZE:
+            _job_id_cache.popitem(last=False)
+        _job_id_cache[cache_key] = job_id
+        _job_id_cache.move_to_end(cache_key)
+
+
 def get_job_id_by_name(job_name: str) -> Optional[str]:
+    """
+    Returns the id of the job with the given jobName, caching found jobs.
+    
+    A job's id never changes, so found ids are served from an in-process LRU cache
+    (up to JOB_ID_CACHE_SIZE entries) on repeat lookups. Misses are not cached,
+    since the job may be created later.
+    
+    Args:
+        job_name: The name of the job
+        
+    Returns:
+        The ID of the job or None if not found
+    """
+    config = get_config()
+    cache_key = _job_id_cache_key(config, job_name)
+    job_id = _get_cached_job_id(cache_key)
+    if job_id is not None:
+        return job_id
+
+    if config.job_name_index is None:
+        job_id = _scan_job_id_by_name(config, job_name)
+    else:
+        job_id = _query_job_id_by_name(job_name)
+    if job_id is not None:
+        _cache_job_id(cache_key, job_id)
+    return job_id
+
+
+@with_exponential_backoff()
+def _query_job_id_by_name(job_name: str) -> Optional[str]:
     """
     Searches DynamoDB table for a job by jobName and returns the matching id.
     
+    Requires a Global Secondary Index (see `set_job_name_index`) with partition
+    key `jobName` and a KEYS_ONLY projection, so the query returns only `id`
+    and `jobName`.
+    
     Args:
         job_name: The name of the job
         
     Returns:
         The ID of the job or None if not found
     """
-    # Use query with limit 1 since we expect only one record with this job name
-    response = dynamo_client.scan(
-        TableName=TABLE_NAME,
-        FilterExpression="jobName = :job_name",
+    # Use query with limit 1 since we expect only one record with this job name.
+    # Limit is applied to items matching the key condition, so unlike a filtered
+    # scan it cannot hide a match behind non-matching items.
+    config = get_config()
+    response = _get_client(config).query(
+        TableName=config.table_name,
+        IndexName=config.job_name_index,
+        KeyConditionExpression="jobName = :job_name",
         ExpressionAttributeValues={":job_name": {"S": job_name}},
-        ProjectionExpression="id",
+        Select="ALL_PROJECTED_ATTRIBUTES",
         Limit=1  # Limit to just one item since job_name should be unique
     )
     
     items = response.get('Items', [])
     if not items:
-        if DEBUG:
-            print(f"No job found with name: {job_name}")
+        logger.debug("No job found with name: %s", job_name)
         return None
         
     # Return just the ID string instead of a list since we expect only one match
     job_id = items[0]["id"]["S"]
-    if DEBUG:
-        print(f"Found job with ID: {job_id}")
+    logger.debug("Found job with ID: %s", job_id)
     return job_id
 
 
 @with_exponential_backoff()
-def update_job_status_by_id(
+def _scan_page(client: Any, **kwargs: Any) -> Dict[str, Any]:
+    """Reads a single Scan page with retries."""
+    return client.scan(**kwargs)
+
+
+def _scan_segment_for_job_name(
+    config: DynamoConfig,
+    job_name: str,
+    segment: int,
+    found: threading.Event
+) -> Optional[str]:
+    """
+    Scans a single segment for a job by jobName, stopping early once any segment finds it.
+    
+    Args:
+        config: The configuration to scan with
+        job_name: The name of the job
+        segment: The segment number to scan
+        found: Set by the first segment that finds the job
+        
+    Returns:
+        The ID of the job or None if not found in this segment
+    """
+    # No Limit here: it would apply before the filter and could skip matches
+    scan_kwargs = {
+        'TableName': config.table_name,
+        'FilterExpression': "jobName = :job_name",
+        'ExpressionAttributeValues': {":job_name": {"S": job_name}},
+        'ProjectionExpression': "id",
+        'Segment': segment,
+        'TotalSegments': SCAN_SEGMENTS,
+    }
+    client = _get_client(config)
+    while not found.is_set():
+        response = _scan_page(client, **scan_kwargs)
+        items = response.get('Items', [])
+        if items:
+            found.set()
+            return items[0]["id"]["S"]
+        last_evaluated_key = response.get('LastEvaluatedKey')
+        if last_evaluated_key is None:
+            return None
+        scan_kwargs['ExclusiveStartKey'] = last_evaluated_key
+    return None
+
+
+def _scan_job_id_by_name(config: DynamoConfig, job_name: str) -> Optional[str]:
+    """
+    Searches DynamoDB table for a job by jobName using a parallel scan.
+    
+    Transitional fallback for tables without a jobName index: it reads the whole
+    table (spread over SCAN_SEGMENTS concurrent segments), so it costs far more
+    read capacity than the indexed query.
+    
+    Args:
+        config: The configuration to scan with
+        job_name: The name of the job
+        
+    Returns:
+        The ID of the job or None if not found
+    """
+    found = threading.Event()
+    job_id = None
+    with ThreadPoolExecutor(max_workers=SCAN_SEGMENTS) as executor:
+        futures = [
+            executor.submit(_scan_segment_for_job_name, config, job_name, segment, found)
+            for segment in range(SCAN_SEGMENTS)
+        ]
+        try:
+            for future in as_completed(futures):
+                job_id = future.result()
+                if job_id is not None:
+                    break
+        finally:
+            # Stop the remaining segments from reading further pages
+            found.set()
+    
+    if job_id is None:
+        logger.debug("No job found with name: %s", job_name)
+    else:
+        logger.debug("Found job with ID: %s", job_id)
+    return job_id
+
+
+def _job_status_update_request(
+    config: DynamoConfig,
     job_id: str,
     status: str,
-    message: Optional[str] = None,
-    output_key: Optional[str] = None
+    message: Optional[str],
+    output_key: Optional[str]
 ) -> Dict[str, Any]:
     """
-    Updates the jobStatus of an item identified by its id in DynamoDB.
+    Builds the UpdateItem arguments used by update_job_status_by_id.
     
-    Args:
-        job_id: The ID of the job
-        status: The status of the job
-        message: The message of the job
-        output_key: The key of the output file
-        
     Returns:
-        The response from DynamoDB
+        Keyword arguments for the client's update_item call
     """
-    # Start with basic update expression and values
-    update_expression = "SET jobStatus = :status, updatedAt = :updated_at"
+    now_iso = datetime.now(UTC).isoformat()
+    
+    # if job ended, completedAt is set as well
+    is_terminal = status in _TERMINAL_STATES
+    update_expression, condition_expression = _UPDATE_EXPRESSIONS[
+        (message is not None, output_key is not None, is_terminal)
+    ]
     expression_values = {
         ':status': {'S': status},
-        ':updated_at': {'S': datetime.now(UTC).isoformat()}
+        ':updated_at': {'S': now_iso}
     }
-    
-    # Conditionally add message if provided
     if message is not None:
-        update_expression += ", message = :message"
         expression_values[':message'] = {'S': message}
-    
-    # Conditionally add output_key if provided
     if output_key is not None:
-        update_expression += ", outputKey = :output_key"
         expression_values[':output_key'] = {'S': output_key}
-
-    # if job ended, add completedAt
-    if status == JobStatus.COMPLETE or status == JobStatus.FAILED:
-        update_expression += ", completedAt = :completed_at"
-        expression_values[':completed_at'] = {'S': datetime.now(UTC).isoformat()}
+    if is_terminal:
+        expression_values[':completed_at'] = {'S': now_iso}
     
-    response = dynamo_client.update_item(
-        TableName=TABLE_NAME,
-        Key={
+    return {
+        'TableName': config.table_name,
+        'Key': {
             'id': {'S': job_id}
         },
-        UpdateExpression=update_expression,
-        ExpressionAttributeValues=expression_values,
-        ReturnValues="UPDATED_NEW"
-    )
-    if DEBUG:
-        print(f"Job status updated successfully")
+        'UpdateExpression': update_expression,
+        'ConditionExpression': condition_expression,
+        'ExpressionAttributeValues': expression_values,
+        'ReturnValues': "UPDATED_NEW",
+        'ReturnValuesOnConditionCheckFailure': "ALL_OLD",
+    }
+
+
+def _skipped_job_status_update(error: ClientError, job_id: str, status: str) -> Dict[str, Any]:
+    """
+    Treats a failed status-update condition as a successful no-op.
+    
+    Raises:
+        ClientError: If the error is anything other than ConditionalCheckFailedException
+        
+    Returns:
+        {'Attributes': <current item>}
+    """
+    if error.response.get('Error', {}).get('Code') != "ConditionalCheckFailedException":
+        raise error
+    # Nothing changed - treat the repeated update as a success
+    logger.debug("Job %s already has status %s, skipping update", job_id, status)
+    return {'Attributes': error.response.get('Item', {})}
+
+
+@with_exponential_backoff()
+def update_job_status_by_id(
+    job_id: str,
+    status: str,
+    message: Optional[str] = None,
+    output_key: Optional[str] = None
+) -> Dict[str, Any]:
+    """
+    Updates the jobStatus of an item identified by its id in DynamoDB.
+    
+    The write is conditional: if the job already has this status (and the same
+    message / output key, when given), DynamoDB skips the write, so updatedAt is
+    left unchanged and no stream record is produced. The rejected write is still
+    charged write capacity.
+    
+    Args:
+        job_id: The ID of the job
+        status: The status of the job
+        message: The message of the job
+        output_key: The key of the output file
+        
+    Returns:
+        The update_item response (only the UPDATED_NEW attributes, plus
+        ResponseMetadata) if the job was updated. If the write was skipped,
+        {'Attributes': <full stored item>} with no ResponseMetadata.
+    """
+    config = get_config()
+    request = _job_status_update_request(config, job_id, status, message, output_key)
+    try:
+        response = _get_client(config).update_item(**request)
+    except ClientError as e:
+        return _skipped_job_status_update(e, job_id, status)
+    logger.debug("Job status updated successfully")
     return response
 
 
 @with_exponential_backoff()
 def update_parent_job_id(
     job_id: str,
-    input_key: str
-) -> None:
+    input_key: Optional[str] = None,
+    parent_job_id: Optional[str] = None
+) -> bool:
     """
     Updates the parentJobId of an item identified by  `input_key` == parent_job[output_key].
     
+    If the caller already knows the parent's ID, pass `parent_job_id` to skip the
+    lookup and update the job with a single DynamoDB call.
+    
+    Otherwise requires a Global Secondary Index (see `set_output_key_index`) with
+    partition key `outputKey` that projects `id` (a KEYS_ONLY projection is sufficient).
+    
     Args:
         job_id: The ID of the job
         input_key: The key of the input file
+        parent_job_id: The ID of the parent job, if already known
 
     Returns:
         True if the parent job id was updated, False otherwise
     """
-    # get parent job id from dynamo
-    response = dynamo_client.scan(
-        TableName=TABLE_NAME,
-        FilterExpression="outputKey = :output_key",
-        ExpressionAttributeValues={":output_key": {"S": input_key}},
-        ProjectionExpression="id"
-    )
-    
-    items = response.get('Items', [])
-    if not items:
-        if DEBUG:
-            print(f"❌ No parent job found for input key: {input_key}")
-        return False
-    
-    parent_job_id = items[0]["id"]["S"]
+    config = get_config()
+    if parent_job_id is None:
+        if input_key is None:
+            raise ValueError("Either input_key or parent_job_id must be provided")
+
+        # get parent job id from dynamo
+        response = _get_client(config).query(
+            TableName=config.table_name,
+            IndexName=config.output_key_index,
+            KeyConditionExpression="outputKey = :output_key",
+            ExpressionAttributeValues={":output_key": {"S": input_key}},
+            ProjectionExpression="id",
+            Limit=1
+        )
+        
+        items = response.get('Items', [])
+        if not items:
+            logger.debug("❌ No parent job found for input key: %s", input_key)
+            return False
+        
+        parent_job_id = items[0]["id"]["S"]
     
     # update item to have parentJobId
-    dynamo_client.update_item(
-        TableName=TABLE_NAME,
+    _get_client(config).update_item(
+        TableName=config.table_name,
         Key={'id': {'S': job_id}},
         UpdateExpression="SET parentJobId = :parent_job_id",
         ExpressionAttributeValues={':parent_job_id': {'S': parent_job_id}}
     )
-    if DEBUG:
-        print(f"✅ Successfully updated parentJobId for job {job_id} to {parent_job_id}")
+    logger.debug("✅ Successfully updated parentJobId for job %s to %s", job_id, parent_job_id)
     return True
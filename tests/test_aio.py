@@ -0,0 +1,157 @@
+import asyncio
+import unittest
+from unittest.mock import patch, AsyncMock, MagicMock
+from botocore.exceptions import ClientError
+from dynamo_job_status.dynamodb import (
+    JobStatus,
+    DynamoConfig,
+    clear_job_id_cache,
+    set_table_name
+)
+from dynamo_job_status.aio import (
+    acreate_job_log,
+    aget_job_id_by_name,
+    aupdate_job_status_by_id,
+    aupdate_parent_job_id,
+    async_dynamo_client
+)
+
+
+class TestAsyncDynamoUtils(unittest.IsolatedAsyncioTestCase):
+    
+    def setUp(self):
+        # Fresh default config so tests do not leak settings
+        self.config_patcher = patch(
+            'dynamo_job_status.dynamodb._default_config',
+            DynamoConfig()
+        )
+        self.config_patcher.start()
+        
+        # Set a test table name
+        set_table_name("test-table")
+        
+        # Start each test with an empty lookup cache
+        clear_job_id_cache()
+        
+        # Create a mock for the async DynamoDB client
+        self.mock_dynamo = AsyncMock()
+        
+    def tearDown(self):
+        # Stop the patcher
+        self.config_patcher.stop()
+        
+    async def test_acreate_job_log_concurrently(self):
+        # Configure the mock
+        self.mock_dynamo.put_item.return_value = {}
+        
+        # Create several jobs concurrently with a shared client
+        async with async_dynamo_client(self.mock_dynamo):
+            job_ids = await asyncio.gather(*[
+                acreate_job_log("test-job", "test-type", f"input-{i}.txt", "test-bucket")
+                for i in range(5)
+            ])
+        
+        # Verify each job was written to the test table
+        self.assertEqual(self.mock_dynamo.put_item.await_count, 5)
+        written_ids = [c[1]['Item']['id']['S'] for c in self.mock_dynamo.put_item.call_args_list]
+        self.assertEqual(sorted(written_ids), sorted(job_ids))
+        for call_args in self.mock_dynamo.put_item.call_args_list:
+            self.assertEqual(call_args[1]['TableName'], "test-table")
+            self.assertEqual(call_args[1]['Item']['jobStatus']['S'], JobStatus.PENDING)
+        
+    async def test_aget_job_id_by_name_found_and_cached(self):
+        # Mock response for when job is found
+        self.mock_dynamo.query.return_value = {
+            'Items': [{'id': {'S': 'test-uuid'}}]
+        }
+        
+        async with async_dynamo_client(self.mock_dynamo):
+            first = await aget_job_id_by_name("existing-job")
+            second = await aget_job_id_by_name("existing-job")
+        
+        # Verify the index was queried once and the cached id reused
+        self.assertEqual(first, "test-uuid")
+        self.assertEqual(second, "test-uuid")
+        self.mock_dynamo.query.assert_awaited_once()
+        query_args = self.mock_dynamo.query.call_args[1]
+        self.assertEqual(query_args['IndexName'], "jobName-index")
+        
+    async def test_aupdate_job_status_repeated_update_returns_current_item(self):
+        # Mock DynamoDB rejecting the no-op update
+        current_item = {'jobStatus': {'S': JobStatus.COMPLETE}}
+        self.mock_dynamo.update_item.side_effect = ClientError(
+            {
+                'Error': {'Code': 'ConditionalCheckFailedException'},
+                'Item': current_item
+            },
+            'UpdateItem'
+        )
+        
+        async with async_dynamo_client(self.mock_dynamo):
+            response = await aupdate_job_status_by_id(
+                job_id="test-job-id",
+                status=JobStatus.COMPLETE
+            )
+        
+        # Verify the same conditional update as the sync version was sent
+        call_args = self.mock_dynamo.update_item.call_args[1]
+        self.assertIn("completedAt = :completed_at", call_args['UpdateExpression'])
+        self.assertIn("jobStatus <> :status", call_args['ConditionExpression'])
+        self.assertEqual(response, {'Attributes': current_item})
+        
+    async def test_aupdate_parent_job_id_found(self):
+        # Mock query response when parent job is found
+        self.mock_dynamo.query.return_value = {
+            'Items': [{'id': {'S': 'parent-job-id'}}]
+        }
+        
+        async with async_dynamo_client(self.mock_dynamo):
+            updated = await aupdate_parent_job_id(
+                job_id="child-job-id",
+                input_key="parent-output.json"
+            )
+        
+        # Verify update_item was called with correct parameters
+        self.assertTrue(updated)
+        update_args = self.mock_dynamo.update_item.call_args[1]
+        self.assertEqual(update_args['Key']['id']['S'], "child-job-id")
+        self.assertEqual(update_args['ExpressionAttributeValues'][':parent_job_id']['S'], "parent-job-id")
+        
+    @patch('dynamo_job_status.aio._session', None)
+    @patch('dynamo_job_status.aio.aioboto3')
+    async def test_calls_outside_block_share_one_session(self, mock_aioboto3):
+        # Session().client(...) returns an async context manager yielding the mock client
+        client_context = MagicMock()
+        client_context.__aenter__ = AsyncMock(return_value=self.mock_dynamo)
+        client_context.__aexit__ = AsyncMock(return_value=False)
+        mock_aioboto3.Session.return_value.client.return_value = client_context
+        self.mock_dynamo.put_item.return_value = {}
+        
+        # Call without an async_dynamo_client block
+        await acreate_job_log("test-job", "test-type", "input-1.txt", "test-bucket")
+        await acreate_job_log("test-job", "test-type", "input-2.txt", "test-bucket")
+        
+        # Verify a single session was created and reused for both writes
+        mock_aioboto3.Session.assert_called_once()
+        self.assertEqual(self.mock_dynamo.put_item.await_count, 2)
+        
+    @patch('asyncio.sleep', new_callable=AsyncMock)
+    async def test_async_retries_throttling_errors(self, mock_sleep):
+        # First call is throttled, second succeeds
+        self.mock_dynamo.put_item.side_effect = [
+            ClientError({'Error': {'Code': 'ThrottlingException'}}, 'PutItem'),
+            {},
+        ]
+        
+        async with async_dynamo_client(self.mock_dynamo):
+            job_id = await acreate_job_log("test-job", "test-type", "input.txt", "test-bucket")
+        
+        # Verify the same item was retried after an async wait
+        self.assertEqual(self.mock_dynamo.put_item.await_count, 2)
+        written_ids = [c[1]['Item']['id']['S'] for c in self.mock_dynamo.put_item.call_args_list]
+        self.assertEqual(written_ids, [job_id, job_id])
+        mock_sleep.assert_awaited_once()
+
+
+if __name__ == "__main__":
+    unittest.main()
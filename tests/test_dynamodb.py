@@ -1,29 +1,49 @@
+import logging
+import os
+import subprocess
+import sys
 import unittest
 from unittest.mock import patch, MagicMock
 import boto3
+from dynamo_job_status import UnprocessedItemsError
 from dynamo_job_status.dynamodb import (
     create_job_log,
     get_job_id_by_name,
+    clear_job_id_cache,
     update_job_status_by_id,
     update_parent_job_id,
     JobStatus,
-    set_table_name
+    JobLogBatcher,
+    DynamoConfig,
+    get_config,
+    use_config,
+    set_table_name,
+    set_debug,
+    with_exponential_backoff
 )
+from botocore.exceptions import ClientError, EndpointConnectionError, ReadTimeoutError
 
 
 class TestDynamoUtils(unittest.TestCase):
     
     def setUp(self):
+        # Create a mock for the DynamoDB client in a fresh default config
+        self.mock_dynamo = MagicMock()
+        self.config_patcher = patch(
+            'dynamo_job_status.dynamodb._default_config',
+            DynamoConfig(client=self.mock_dynamo)
+        )
+        self.config_patcher.start()
+        
         # Set a test table name
         set_table_name("test-table")
         
-        # Create a mock for the DynamoDB client
-        self.mock_dynamo_patcher = patch('dynamo_job_status.dynamodb.dynamo_client')
-        self.mock_dynamo = self.mock_dynamo_patcher.start()
+        # Start each test with an empty lookup cache
+        clear_job_id_cache()
         
     def tearDown(self):
         # Stop the patcher
-        self.mock_dynamo_patcher.stop()
+        self.config_patcher.stop()
         
     def test_create_job_log(self):
         # Configure the mock
@@ -47,24 +67,254 @@ class TestDynamoUtils(unittest.TestCase):
         # Check the job name in the item
         self.assertEqual(call_args['Item']['jobName']['S'], "test-job")
         
-        # Check job ID was returned
+        # Check both timestamps come from the same instant
+        self.assertEqual(call_args['Item']['createdAt'], call_args['Item']['updatedAt'])
+        
+        # Check job ID was returned as a 32-char hex UUID
         self.assertIsNotNone(job_id)
+        self.assertRegex(job_id, r'^[0-9a-f]{32}$')
+        self.assertEqual(call_args['Item']['id']['S'], job_id)
+        
+    def test_use_config_overrides_table_for_block_only(self):
+        self.mock_dynamo.put_item.return_value = {}
+        
+        # Write one job with an overridden table and one without
+        with use_config(table_name="other-table") as config:
+            self.assertEqual(config.table_name, "other-table")
+            self.assertIs(get_config(), config)
+            create_job_log("test-job", "test-type", "input-1.txt", "test-bucket")
+        create_job_log("test-job", "test-type", "input-2.txt", "test-bucket")
+        
+        # Verify the override only applied inside the block
+        tables = [c[1]['TableName'] for c in self.mock_dynamo.put_item.call_args_list]
+        self.assertEqual(tables, ["other-table", "test-table"])
+        self.assertEqual(get_config().table_name, "test-table")
+        
+    @patch('dynamo_job_status.dynamodb._default_client', None)
+    @patch('boto3.client')
+    def test_default_client_is_created_on_first_use(self, mock_boto3_client):
+        # Fall back to the default client
+        with use_config(client=None):
+            mock_boto3_client.assert_not_called()
+            get_job_id_by_name("job-1")
+            get_job_id_by_name("job-2")
+        
+        # Verify the client was created once, lazily, and reused
+        mock_boto3_client.assert_called_once()
+        self.assertEqual(mock_boto3_client.call_args[0], ('dynamodb',))
+        self.assertEqual(mock_boto3_client.return_value.query.call_count, 2)
+        self.mock_dynamo.query.assert_not_called()
+        
+    def test_import_does_not_load_asyncio(self):
+        # Run in a fresh interpreter, since the test runner may already have loaded asyncio
+        result = subprocess.run(
+            [sys.executable, "-c", "import sys, dynamo_job_status; print('asyncio' in sys.modules)"],
+            capture_output=True, text=True, check=True,
+            env={**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+        )
+        self.assertEqual(result.stdout.strip(), "False")
+        
+    def test_job_status_values_are_plain_strings(self):
+        # JobStatus members compare and serialize as their string values
+        self.assertEqual(JobStatus.COMPLETE, "COMPLETE")
+        self.assertEqual(str(JobStatus.PENDING), "PENDING")
+        self.assertIs(JobStatus("FAILED"), JobStatus.FAILED)
+        
+    def test_job_log_batcher_flushes_on_exit(self):
+        # Configure the mock
+        self.mock_dynamo.batch_write_item.return_value = {'UnprocessedItems': {}}
+        
+        # Create jobs inside the batcher
+        with JobLogBatcher():
+            job_ids = [
+                create_job_log("test-job", "test-type", f"input-{i}.txt", "test-bucket")
+                for i in range(3)
+            ]
+            # Nothing is written until the block exits
+            self.mock_dynamo.batch_write_item.assert_not_called()
+        
+        # Verify a single batch write with all items and no put_item calls
+        self.mock_dynamo.put_item.assert_not_called()
+        self.mock_dynamo.batch_write_item.assert_called_once()
+        requests = self.mock_dynamo.batch_write_item.call_args[1]['RequestItems']['test-table']
+        self.assertEqual(
+            [r['PutRequest']['Item']['id']['S'] for r in requests],
+            job_ids
+        )
+        
+    def test_job_log_batcher_flushes_every_25_items(self):
+        # Configure the mock
+        self.mock_dynamo.batch_write_item.return_value = {'UnprocessedItems': {}}
+        
+        # Create more jobs than fit in a single batch
+        with JobLogBatcher():
+            for i in range(30):
+                create_job_log("test-job", "test-type", f"input-{i}.txt", "test-bucket")
+        
+        # Verify the writes were split into batches of at most 25
+        batch_sizes = [
+            len(c[1]['RequestItems']['test-table'])
+            for c in self.mock_dynamo.batch_write_item.call_args_list
+        ]
+        self.assertEqual(batch_sizes, [25, 5])
+        
+    def test_job_log_batcher_writes_to_table_active_when_logged(self):
+        # Configure the mock
+        self.mock_dynamo.batch_write_item.return_value = {'UnprocessedItems': {}}
+        
+        # Log one job under an overridden table and one under the default
+        with JobLogBatcher():
+            with use_config(table_name="other-table"):
+                other_id = create_job_log("test-job", "test-type", "input-1.txt", "test-bucket")
+            default_id = create_job_log("test-job", "test-type", "input-2.txt", "test-bucket")
+        
+        # Verify each item went to the table it was logged under
+        written = {}
+        for c in self.mock_dynamo.batch_write_item.call_args_list:
+            for table, requests in c[1]['RequestItems'].items():
+                written.setdefault(table, []).extend(
+                    r['PutRequest']['Item']['id']['S'] for r in requests
+                )
+        self.assertEqual(written, {"other-table": [other_id], "test-table": [default_id]})
+        
+    @patch('time.sleep')
+    def test_job_log_batcher_retries_unprocessed_items(self, mock_sleep):
+        # First call leaves one item unprocessed, second call succeeds
+        unprocessed_request = {'PutRequest': {'Item': {'id': {'S': 'leftover'}}}}
+        self.mock_dynamo.batch_write_item.side_effect = [
+            {'UnprocessedItems': {'test-table': [unprocessed_request]}},
+            {'UnprocessedItems': {}},
+        ]
+        
+        with JobLogBatcher():
+            create_job_log("test-job", "test-type", "input-1.txt", "test-bucket")
+            create_job_log("test-job", "test-type", "input-2.txt", "test-bucket")
+        
+        # Verify only the unprocessed item was resent
+        self.assertEqual(self.mock_dynamo.batch_write_item.call_count, 2)
+        retry_args = self.mock_dynamo.batch_write_item.call_args[1]
+        self.assertEqual(retry_args['RequestItems']['test-table'], [unprocessed_request])
+        
+    @patch('random.uniform', side_effect=lambda low, high: high)
+    @patch('time.sleep')
+    def test_with_exponential_backoff_retries_then_raises(self, mock_sleep, mock_uniform):
+        # Operation that always fails with a ClientError
+        error = ClientError({'Error': {'Code': 'ThrottlingException'}}, 'PutItem')
+        operation = MagicMock(side_effect=error)
+        decorated = with_exponential_backoff(max_attempts=4, min_wait=2, max_wait=5)(operation)
+        
+        with self.assertRaises(ClientError):
+            decorated()
+        
+        # Verify every attempt was made with jittered waits under a doubling, capped bound
+        self.assertEqual(operation.call_count, 4)
+        self.assertEqual([c[0] for c in mock_uniform.call_args_list], [(0, 2), (0, 4), (0, 5)])
+        self.assertEqual([c[0][0] for c in mock_sleep.call_args_list], [2, 4, 5])
+        
+    @patch('time.sleep')
+    def test_put_item_retries_connection_errors_and_timeouts(self, mock_sleep):
+        # Connection error, then a timeout, then success
+        self.mock_dynamo.put_item.side_effect = [
+            EndpointConnectionError(endpoint_url="https://dynamodb.us-east-1.amazonaws.com"),
+            ReadTimeoutError(endpoint_url="https://dynamodb.us-east-1.amazonaws.com"),
+            {},
+        ]
+        
+        create_job_log("test-job", "test-type", "input.txt", "test-bucket")
+        
+        # Verify both transport errors were retried
+        self.assertEqual(self.mock_dynamo.put_item.call_count, 3)
+        self.assertEqual(mock_sleep.call_count, 2)
+        
+    def test_with_exponential_backoff_rejects_non_positive_max_attempts(self):
+        # A decorator that would never call the function is a configuration error
+        for max_attempts in (0, -1):
+            with self.assertRaises(ValueError):
+                with_exponential_backoff(max_attempts=max_attempts)
+        
+        # A single attempt still calls the function
+        self.assertEqual(with_exponential_backoff(max_attempts=1)(lambda: 'ran')(), 'ran')
+        
+    @patch('time.sleep')
+    def test_with_exponential_backoff_does_not_retry_validation_errors(self, mock_sleep):
+        # Operation that fails with a deterministic error
+        error = ClientError({'Error': {'Code': 'ValidationException'}}, 'PutItem')
+        operation = MagicMock(side_effect=error)
+        decorated = with_exponential_backoff()(operation)
+        
+        with self.assertRaises(ClientError):
+            decorated()
+        
+        # Verify the error was raised on the first attempt without waiting
+        operation.assert_called_once()
+        mock_sleep.assert_not_called()
+        
+    def test_job_log_batcher_keeps_items_when_flush_fails(self):
+        # First flush fails with a non-retryable error, the second succeeds
+        self.mock_dynamo.batch_write_item.side_effect = [
+            ClientError({'Error': {'Code': 'ValidationException'}}, 'BatchWriteItem'),
+            {'UnprocessedItems': {}},
+        ]
+        
+        batcher = JobLogBatcher()
+        with self.assertRaises(ClientError):
+            with batcher:
+                job_id = create_job_log("test-job", "test-type", "input.txt", "test-bucket")
+        
+        # Verify the item is still buffered and written by a later flush
+        batcher.flush()
+        self.assertEqual(self.mock_dynamo.batch_write_item.call_count, 2)
+        requests = self.mock_dynamo.batch_write_item.call_args[1]['RequestItems']['test-table']
+        self.assertEqual([r['PutRequest']['Item']['id']['S'] for r in requests], [job_id])
+        self.assertEqual(batcher.buffers, {})
+        
+    @patch('time.sleep')
+    def test_job_log_batcher_raises_public_unprocessed_items_error(self, mock_sleep):
+        # Every attempt leaves the same item unprocessed
+        unprocessed_request = {'PutRequest': {'Item': {'id': {'S': 'leftover'}}}}
+        self.mock_dynamo.batch_write_item.return_value = {
+            'UnprocessedItems': {'test-table': [unprocessed_request]}
+        }
+        
+        batcher = JobLogBatcher()
+        with self.assertRaises(UnprocessedItemsError):
+            with batcher:
+                create_job_log("test-job", "test-type", "input-1.txt", "test-bucket")
+                create_job_log("test-job", "test-type", "input-2.txt", "test-bucket")
+        
+        # Verify only the unprocessed item stays buffered
+        buffered = [requests for _, requests in batcher.buffers.values()]
+        self.assertEqual(buffered, [[unprocessed_request]])
         
     def test_get_job_id_by_name_found(self):
         # Mock response for when job is found
-        self.mock_dynamo.scan.return_value = {
+        self.mock_dynamo.query.return_value = {
             'Items': [{'id': {'S': 'test-uuid'}}]
         }
         
         # Call the function
         job_id = get_job_id_by_name("existing-job")
         
+        # Verify query was issued against the jobName index
+        query_args = self.mock_dynamo.query.call_args[1]
+        self.assertEqual(query_args['TableName'], "test-table")
+        self.assertEqual(query_args['IndexName'], "jobName-index")
+        self.assertEqual(query_args['ExpressionAttributeValues'][':job_name']['S'], "existing-job")
+        self.assertEqual(query_args['Select'], "ALL_PROJECTED_ATTRIBUTES")
+        self.assertNotIn('ProjectionExpression', query_args)
+        
+        # Limit must only be combined with a key condition, never a post-read filter
+        self.assertEqual(query_args['Limit'], 1)
+        self.assertEqual(query_args['KeyConditionExpression'], "jobName = :job_name")
+        self.assertNotIn('FilterExpression', query_args)
+        self.mock_dynamo.scan.assert_not_called()
+        
         # Verify correct result is returned
         self.assertEqual(job_id, "test-uuid")
         
     def test_get_job_id_by_name_not_found(self):
         # Mock response for when job is not found
-        self.mock_dynamo.scan.return_value = {'Items': []}
+        self.mock_dynamo.query.return_value = {'Items': []}
         
         # Call the function
         job_id = get_job_id_by_name("non-existent-job")
@@ -72,6 +322,123 @@ class TestDynamoUtils(unittest.TestCase):
         # Verify None is returned
         self.assertIsNone(job_id)
         
+    def test_get_job_id_by_name_logs_miss_at_debug_level(self):
+        # Mock response for when job is not found
+        self.mock_dynamo.query.return_value = {'Items': []}
+        
+        # Verify the miss is reported through logging rather than print
+        with self.assertLogs('dynamo_job_status.dynamodb', level='DEBUG') as logs:
+            get_job_id_by_name("non-existent-job")
+        self.assertIn("No job found with name: non-existent-job", logs.output[0])
+        
+    def test_get_job_id_by_name_caches_found_jobs(self):
+        # Mock response for when job is found
+        self.mock_dynamo.query.return_value = {
+            'Items': [{'id': {'S': 'test-uuid'}}]
+        }
+        
+        # Look up the same job twice
+        first = get_job_id_by_name("existing-job")
+        second = get_job_id_by_name("existing-job")
+        
+        # Verify only the first lookup reached DynamoDB
+        self.assertEqual(first, "test-uuid")
+        self.assertEqual(second, "test-uuid")
+        self.mock_dynamo.query.assert_called_once()
+        
+    @patch('dynamo_job_status.dynamodb.JOB_ID_CACHE_SIZE', 2)
+    def test_get_job_id_by_name_evicts_least_recently_used(self):
+        # Each job name maps to an id derived from it
+        self.mock_dynamo.query.side_effect = lambda **kwargs: {
+            'Items': [{'id': {'S': kwargs['ExpressionAttributeValues'][':job_name']['S'] + '-id'}}]
+        }
+        
+        # Fill the cache, touch job-a, then add job-c
+        get_job_id_by_name("job-a")
+        get_job_id_by_name("job-b")
+        get_job_id_by_name("job-a")
+        get_job_id_by_name("job-c")
+        self.assertEqual(self.mock_dynamo.query.call_count, 3)
+        
+        # Verify job-a stayed cached and job-b was evicted
+        get_job_id_by_name("job-a")
+        self.assertEqual(self.mock_dynamo.query.call_count, 3)
+        get_job_id_by_name("job-b")
+        self.assertEqual(self.mock_dynamo.query.call_count, 4)
+        
+    def test_get_job_id_by_name_cache_is_per_client(self):
+        # Two clients pointing at different environments with the same table name
+        self.mock_dynamo.query.return_value = {'Items': [{'id': {'S': 'default-uuid'}}]}
+        other_dynamo = MagicMock()
+        other_dynamo.query.return_value = {'Items': [{'id': {'S': 'other-uuid'}}]}
+        
+        self.assertEqual(get_job_id_by_name("existing-job"), "default-uuid")
+        with use_config(client=other_dynamo):
+            self.assertEqual(get_job_id_by_name("existing-job"), "other-uuid")
+        
+        # Verify each client was queried rather than served the other's cached id
+        self.mock_dynamo.query.assert_called_once()
+        other_dynamo.query.assert_called_once()
+        
+    def test_get_job_id_by_name_does_not_cache_misses(self):
+        # First lookup misses, second finds the newly created job
+        self.mock_dynamo.query.side_effect = [
+            {'Items': []},
+            {'Items': [{'id': {'S': 'test-uuid'}}]},
+        ]
+        
+        self.assertIsNone(get_job_id_by_name("new-job"))
+        self.assertEqual(get_job_id_by_name("new-job"), "test-uuid")
+        self.assertEqual(self.mock_dynamo.query.call_count, 2)
+        
+    def test_get_job_id_by_name_without_index_uses_parallel_scan(self):
+        # Segment 3 finds the job on its second page, the others are empty
+        def scan(**kwargs):
+            if kwargs['Segment'] != 3:
+                return {'Items': []}
+            if 'ExclusiveStartKey' not in kwargs:
+                return {'Items': [], 'LastEvaluatedKey': {'id': {'S': 'page-1'}}}
+            return {'Items': [{'id': {'S': 'test-uuid'}}]}
+        self.mock_dynamo.scan.side_effect = scan
+        
+        with use_config(job_name_index=None):
+            job_id = get_job_id_by_name("existing-job")
+        
+        # Verify segments were scanned without a Limit and no query was made
+        self.assertEqual(job_id, "test-uuid")
+        self.mock_dynamo.query.assert_not_called()
+        scan_calls = [c[1] for c in self.mock_dynamo.scan.call_args_list]
+        self.assertIn({'id': {'S': 'page-1'}}, [c.get('ExclusiveStartKey') for c in scan_calls])
+        for call_args in scan_calls:
+            self.assertEqual(call_args['TotalSegments'], 8)
+            self.assertEqual(call_args['ExpressionAttributeValues'][':job_name']['S'], "existing-job")
+            self.assertNotIn('Limit', call_args)
+        
+    def test_get_job_id_by_name_without_index_not_found(self):
+        # Every segment is empty
+        self.mock_dynamo.scan.return_value = {'Items': []}
+        
+        with use_config(job_name_index=None):
+            job_id = get_job_id_by_name("non-existent-job")
+        
+        # Verify None is returned after one page per segment
+        self.assertIsNone(job_id)
+        self.assertEqual(self.mock_dynamo.scan.call_count, 8)
+        
+    def test_set_debug_reuses_application_logging_handlers(self):
+        module_logger = logging.getLogger('dynamo_job_status.dynamodb')
+        root_handler = logging.NullHandler()
+        logging.getLogger().addHandler(root_handler)
+        try:
+            set_debug(True)
+            
+            # Verify no extra handler was attached, so lines are not printed twice
+            self.assertEqual(module_logger.handlers, [])
+            self.assertEqual(module_logger.level, logging.DEBUG)
+        finally:
+            set_debug(False)
+            logging.getLogger().removeHandler(root_handler)
+        
     def test_update_job_status(self):
         # Mock the update_item response
         self.mock_dynamo.update_item.return_value = {
@@ -139,9 +506,48 @@ class TestDynamoUtils(unittest.TestCase):
         call_args = self.mock_dynamo.update_item.call_args[1]
         self.assertIn("completedAt = :completed_at", call_args['UpdateExpression'])
         
+    def test_update_job_status_is_conditional(self):
+        self.mock_dynamo.update_item.return_value = {'Attributes': {}}
+        
+        update_job_status_by_id(
+            job_id="test-job-id",
+            status=JobStatus.COMPLETE,
+            output_key="test-output.json"
+        )
+        
+        # Verify the write is skipped server-side when nothing would change
+        call_args = self.mock_dynamo.update_item.call_args[1]
+        self.assertIn("jobStatus <> :status", call_args['ConditionExpression'])
+        self.assertIn("outputKey <> :output_key", call_args['ConditionExpression'])
+        self.assertEqual(call_args['ReturnValuesOnConditionCheckFailure'], "ALL_OLD")
+        
+    def test_update_job_status_repeated_update_returns_current_item(self):
+        # Mock DynamoDB rejecting the no-op update
+        current_item = {
+            'id': {'S': 'test-job-id'},
+            'jobStatus': {'S': JobStatus.COMPLETE}
+        }
+        self.mock_dynamo.update_item.side_effect = ClientError(
+            {
+                'Error': {'Code': 'ConditionalCheckFailedException'},
+                'Item': current_item
+            },
+            'UpdateItem'
+        )
+        
+        # Call the function
+        response = update_job_status_by_id(
+            job_id="test-job-id",
+            status=JobStatus.COMPLETE
+        )
+        
+        # Verify the update was not retried and the current item is returned
+        self.mock_dynamo.update_item.assert_called_once()
+        self.assertEqual(response, {'Attributes': current_item})
+        
     def test_update_parent_job_id_found(self):
-        # Mock scan response when parent job is found
-        self.mock_dynamo.scan.return_value = {
+        # Mock query response when parent job is found
+        self.mock_dynamo.query.return_value = {
             'Items': [{'id': {'S': 'parent-job-id'}}]
         }
         
@@ -151,10 +557,11 @@ class TestDynamoUtils(unittest.TestCase):
             input_key="parent-output.json"
         )
         
-        # Verify scan was called with correct parameters
-        scan_args = self.mock_dynamo.scan.call_args[1]
-        self.assertEqual(scan_args['TableName'], "test-table")
-        self.assertEqual(scan_args['ExpressionAttributeValues'][':output_key']['S'], "parent-output.json")
+        # Verify query was called with correct parameters
+        query_args = self.mock_dynamo.query.call_args[1]
+        self.assertEqual(query_args['TableName'], "test-table")
+        self.assertEqual(query_args['IndexName'], "outputKey-index")
+        self.assertEqual(query_args['ExpressionAttributeValues'][':output_key']['S'], "parent-output.json")
         
         # Verify update_item was called with correct parameters
         update_args = self.mock_dynamo.update_item.call_args[1]
@@ -162,8 +569,8 @@ class TestDynamoUtils(unittest.TestCase):
         self.assertEqual(update_args['ExpressionAttributeValues'][':parent_job_id']['S'], "parent-job-id")
         
     def test_update_parent_job_id_not_found(self):
-        # Mock scan response when parent job is not found
-        self.mock_dynamo.scan.return_value = {'Items': []}
+        # Mock query response when parent job is not found
+        self.mock_dynamo.query.return_value = {'Items': []}
         
         # Call the function
         update_parent_job_id(
@@ -171,11 +578,33 @@ class TestDynamoUtils(unittest.TestCase):
             input_key="nonexistent-output.json"
         )
         
-        # Verify scan was called
-        self.mock_dynamo.scan.assert_called_once()
+        # Verify query was called
+        self.mock_dynamo.query.assert_called_once()
         
         # Verify update_item was not called
         self.mock_dynamo.update_item.assert_not_called()
+        
+    def test_update_parent_job_id_with_known_parent_skips_lookup(self):
+        # Call the function with the parent ID already known
+        updated = update_parent_job_id(
+            job_id="child-job-id",
+            parent_job_id="parent-job-id"
+        )
+        
+        # Verify no lookup was made and the child was updated directly
+        self.assertTrue(updated)
+        self.mock_dynamo.query.assert_not_called()
+        update_args = self.mock_dynamo.update_item.call_args[1]
+        self.assertEqual(update_args['Key']['id']['S'], "child-job-id")
+        self.assertEqual(update_args['ExpressionAttributeValues'][':parent_job_id']['S'], "parent-job-id")
+        
+    def test_update_parent_job_id_requires_input_key_or_parent(self):
+        with self.assertRaises(ValueError):
+            update_parent_job_id(job_id="child-job-id")
+        
+        # Verify DynamoDB was not called
+        self.mock_dynamo.query.assert_not_called()
+        self.mock_dynamo.update_item.assert_not_called()
 
 
 if __name__ == "__main__":